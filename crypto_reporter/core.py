@@ -0,0 +1,351 @@
+import os
+import asyncio
+import atexit
+import functools
+import queue
+import re
+import threading
+import time
+from datetime import datetime
+from dotenv import load_dotenv
+import httpx
+import jinja2
+import logging
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import List, Dict, Any, Tuple
+from urllib.parse import quote, urlencode
+import sys
+import traceback
+
+# Load .env only if not running on Railway
+if not os.getenv("RAILWAY_ENV"):
+    load_dotenv()
+
+# Setup logging to file and console. INFO by default; DEBUG formatting on
+# every fetch step is not free, so opt in via LOG_LEVEL when debugging.
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+log_file = os.path.join(SCRIPT_DIR, 'crypto_report.log')
+
+# Handlers go behind a queue: a log call from a coroutine is just a queue
+# put, while the listener thread does the actual file/console writes so the
+# event loop never blocks on log I/O.
+_log_queue = queue.Queue(-1)
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_file_handler = RotatingFileHandler(log_file, maxBytes=1_000_000, backupCount=3)
+_file_handler.setFormatter(_log_formatter)
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(_log_formatter)
+
+# Pass-through formatter on the queue side: prepare() only merges the lazy
+# %-args, leaving timestamp/level formatting to the listener's handlers.
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
+logging.basicConfig(
+    level=os.getenv('LOG_LEVEL', 'INFO'),
+    handlers=[_queue_handler]
+)
+
+_log_listener = QueueListener(_log_queue, _file_handler, _stream_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+logger = logging.getLogger(__name__)
+
+# Check required env vars
+required_env_vars = [
+    'NEWS_API_KEY',
+    'EMAIL_SENDER',
+    'EMAIL_PASSWORD',
+    'EMAIL_RECIPIENT',
+    'EMAIL_RECIPIENT2'
+]
+
+missing_vars = [var for var in required_env_vars if not os.getenv(var)]
+if missing_vars:
+    logger.error("Missing environment variables: %s", ', '.join(missing_vars))
+    sys.exit(1)
+
+# Read the email settings once; send_email runs on every report and has no
+# reason to walk os.environ each time.
+EMAIL_SENDER = os.getenv('EMAIL_SENDER')
+EMAIL_PASSWORD = os.getenv('EMAIL_PASSWORD')
+RECIPIENTS = [os.getenv('EMAIL_RECIPIENT'), os.getenv('EMAIL_RECIPIENT2')]
+RECIPIENTS_HEADER = ', '.join(RECIPIENTS)
+
+# The report template is parsed and compiled once at import; every render
+# afterwards reuses the compiled code. autoescape keeps article fields safe,
+# and the urlquote filter percent-encodes anything in an article URL that
+# could otherwise break out of the href attribute.
+JINJA_ENV = jinja2.Environment(autoescape=True)
+JINJA_ENV.filters['urlquote'] = lambda url: quote(url, safe=':/?=&%#')
+with open(os.path.join(SCRIPT_DIR, 'report.html'), encoding='utf-8') as f:
+    TEMPLATE = JINJA_ENV.from_string(f.read())
+
+# Constants
+COINGECKO_API_URL = "https://api.coingecko.com/api/v3"
+CRYPTO_SYMBOLS = ['bitcoin', 'ethereum', 'celestia', 'solana']
+MAX_RETRIES = 3
+RETRY_DELAY = 20
+REPORT_INTERVAL_HOURS = 3
+USER_AGENT = "crypto-news-reporter/1.0"
+PRICE_CACHE_TTL = 300   # CoinGecko's simple/price only refreshes ~once a minute
+NEWS_CACHE_TTL = 900    # headlines move slower than prices
+POLITICAL_KEYWORDS = re.compile(r'\b(regulation|policy|government)\b', re.IGNORECASE)
+
+# The news query never changes, so encode the full URL once at import rather
+# than re-validating and re-encoding the parameters through newsapi-python on
+# every fetch.
+NEWS_URL = "https://newsapi.org/v2/everything?" + urlencode({
+    'q': '(cryptocurrency OR bitcoin OR ethereum) OR ((regulation OR policy OR government) AND (crypto OR bitcoin))',
+    'language': 'en',
+    'sortBy': 'publishedAt',
+    'pageSize': 15,
+    'apiKey': os.getenv('NEWS_API_KEY')
+})
+
+
+def ttl_cache(seconds: int):
+    """Memoize an async function's result for `seconds`, keyed on its args.
+
+    Shields the free-tier APIs from redundant calls when the scheduler
+    interval is shortened or a report is retried.
+    """
+    def decorator(func):
+        cache: Dict[Any, Any] = {}
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            cached = cache.get(key)
+            now = time.monotonic()
+            if cached is not None and now < cached[1]:
+                return cached[0]
+            value = await func(*args, **kwargs)
+            cache[key] = (value, now + seconds)
+            return value
+
+        return wrapper
+    return decorator
+
+# One HTTP/2 client shared across all API calls: concurrent requests to the
+# same host multiplex over a single warm TLS connection instead of opening a
+# connection per request. The loop check is defensive: the whole scheduler
+# runs under a single asyncio.run(), but the client is recreated if the
+# coroutines are ever driven from a fresh loop (e.g. in a one-shot run).
+_client = None
+_client_loop = None
+
+
+async def get_http_client() -> httpx.AsyncClient:
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=10,
+            limits=httpx.Limits(max_keepalive_connections=10),
+            headers={'User-Agent': USER_AGENT}
+        )
+        _client_loop = loop
+    return _client
+
+
+async def close_http_client():
+    global _client
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
+
+
+async def make_api_request(url: str, retries: int = MAX_RETRIES) -> Dict[str, Any]:
+    client = await get_http_client()
+    for attempt in range(retries):
+        try:
+            response = await client.get(url)
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPError as e:
+            if attempt == retries - 1:
+                logger.error("API request failed: %s", e)
+                raise
+            logger.warning("API request failed, retrying in %ds...", RETRY_DELAY)
+            await asyncio.sleep(RETRY_DELAY)
+
+
+@ttl_cache(NEWS_CACHE_TTL)
+async def get_all_news() -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Fetch crypto and political news in one newsapi round trip and
+    partition the articles on the political keywords."""
+    try:
+        news = await make_api_request(NEWS_URL)
+        articles = news.get('articles', [])
+    except Exception as e:
+        logger.error("Error fetching news: %s", e)
+        return [], []
+
+    crypto_news = []
+    political_news = []
+    for article in articles:
+        text = f"{article.get('title') or ''} {article.get('description') or ''}"
+        if POLITICAL_KEYWORDS.search(text) and len(political_news) < 5:
+            political_news.append(article)
+        elif len(crypto_news) < 10:
+            crypto_news.append(article)
+    return crypto_news, political_news
+
+
+@ttl_cache(PRICE_CACHE_TTL)
+async def get_crypto_market_summary() -> List[Dict[str, Any]]:
+    try:
+        summary = []
+        crypto_ids = ','.join(CRYPTO_SYMBOLS)
+        url = f"{COINGECKO_API_URL}/simple/price?ids={crypto_ids}&vs_currencies=usd&include_24hr_change=true"
+
+        data = await make_api_request(url)
+
+        for crypto in CRYPTO_SYMBOLS:
+            if crypto in data:
+                price = data[crypto]['usd']
+                change = data[crypto]['usd_24h_change']
+                summary.append({
+                    'symbol': crypto.upper(),
+                    'price': price,
+                    'change_24h': change
+                })
+            else:
+                logger.warning("No data for %s", crypto)
+
+        if not summary:
+            summary.append({
+                'symbol': 'N/A',
+                'price': 0,
+                'change_24h': 0,
+                'message': 'Crypto data unavailable'
+            })
+
+        return summary
+    except Exception as e:
+        logger.error("Market summary error: %s", e)
+        return [{
+            'symbol': 'N/A',
+            'price': 0,
+            'change_24h': 0,
+            'message': 'Market data error'
+        }]
+
+
+def format_email_content(crypto_news, political_news, market_summary, report_date):
+    return TEMPLATE.render(
+        date=report_date,
+        market=market_summary,
+        crypto=crypto_news,
+        political=political_news
+    )
+
+
+class SMTPPool:
+    """Keeps one authenticated SMTP connection open across sends instead of
+    reconnecting (TCP + TLS + AUTH) for every report."""
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.client = None
+        self.lock = threading.Lock()
+        # Built once on first connect and reused for every reconnect: saves
+        # rebuilding the context (cert loading, cipher setup) and lets TLS
+        # session resumption skip a handshake round trip.
+        self.ssl_context = None
+
+    def _connect(self):
+        # Deferred: smtplib is only needed once per report, not at start-up
+        import smtplib
+        import ssl
+
+        if self.ssl_context is None:
+            self.ssl_context = ssl.create_default_context()
+        self.client = smtplib.SMTP_SSL(self.host, self.port, context=self.ssl_context)
+        self.client.login(EMAIL_SENDER, EMAIL_PASSWORD)
+
+    def _is_alive(self) -> bool:
+        import smtplib
+
+        if self.client is None:
+            return False
+        try:
+            return self.client.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def send(self, msg):
+        with self.lock:
+            if not self._is_alive():
+                self._connect()
+            self.client.send_message(msg)
+
+    def close(self):
+        import smtplib
+
+        with self.lock:
+            if self.client is not None:
+                try:
+                    self.client.quit()
+                except (smtplib.SMTPException, OSError):
+                    pass
+                self.client = None
+
+
+SMTP_POOL = SMTPPool('smtp.gmail.com', 465)
+
+
+def send_email(content: str, report_date: str):
+    from email.mime.multipart import MIMEMultipart
+    from email.mime.text import MIMEText
+
+    try:
+        msg = MIMEMultipart('alternative')
+        msg['Subject'] = f"Crypto Report - {report_date}"
+        msg['From'] = EMAIL_SENDER
+        msg['To'] = RECIPIENTS_HEADER
+        msg.attach(MIMEText(content, 'html'))
+
+        SMTP_POOL.send(msg)
+        logger.info("Email sent successfully.")
+    except Exception as e:
+        logger.error("Failed to send email: %s", e)
+        logger.error(traceback.format_exc())
+
+
+async def generate_and_send_report():
+    missing_vars = [var for var in required_env_vars if not os.getenv(var)]
+    if missing_vars:
+        logger.error("Missing vars: %s", missing_vars)
+        return
+    logger.info("Generating and sending report...")
+    try:
+        report_date = datetime.now().strftime('%Y-%m-%d')
+
+        # The two fetches are independent, so run them concurrently
+        (crypto_news, political_news), market_summary = await asyncio.gather(
+            get_all_news(),
+            get_crypto_market_summary()
+        )
+
+        email_content = format_email_content(crypto_news, political_news, market_summary, report_date)
+        send_email(email_content, report_date)
+    except Exception as e:
+        logger.error("Error in report generation: %s", e)
+        logger.error(traceback.format_exc())
+
+
+async def scheduler():
+    # Runs immediately on startup, then every REPORT_INTERVAL_HOURS.
+    # await asyncio.sleep() yields the loop between ticks instead of
+    # holding a thread hostage in a sleep/poll cycle.
+    try:
+        while True:
+            await generate_and_send_report()
+            await asyncio.sleep(REPORT_INTERVAL_HOURS * 3600)
+    finally:
+        await close_http_client()